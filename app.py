@@ -1,15 +1,20 @@
 # app.py
+import hashlib
 import os
+import re
 import time
+import threading
 import traceback
-from datetime import datetime, timezone, timedelta
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, wraps
+
+import numpy as np
+import orjson
+from cachetools import TTLCache
+from cachetools.keys import hashkey
 from dotenv import load_dotenv
-from flask import Flask, render_template, request, jsonify
-
-# ML / NLP
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from flask import Flask, render_template, request
 
 # YouTube API
 from googleapiclient.discovery import build
@@ -30,32 +35,132 @@ MAX_CHANNELS = 5
 SHORTS_MAX_SECONDS = 60
 BATCH_SIZE = 50
 RECENT_DAYS = 30
+# Enough channel workers for every gevent connection (--worker-connections
+# 100 in Procfile) to analyze MAX_CHANNELS at once; threads start on demand
+WORKER_CONNECTIONS = 100
+CHANNEL_WORKERS = WORKER_CONNECTIONS * MAX_CHANNELS
+METADATA_WORKERS = 8
+REQUESTS_PER_HTTP_BATCH = 10
+MAX_RETRIES = 4
+MAX_RETRY_AFTER = 30
+RETRYABLE_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+CHANNEL_CACHE_TTL = 300
+PLAYLIST_CACHE_TTL = 60
+RESPONSE_CACHE_TTL = 60
+
+# Partial-response masks: only request the fields the analyzer reads
+CHANNEL_FIELDS = "items(snippet(title,thumbnails/high/url),statistics/subscriberCount,contentDetails/relatedPlaylists/uploads)"
+PLAYLIST_ITEM_FIELDS = "items(contentDetails/videoId),nextPageToken"
+VIDEO_FIELDS = "items(id,snippet(title,description,publishedAt),statistics/viewCount,contentDetails/duration)"
 
 
 # ------------------------------------------------------
 # HELPERS
 # ------------------------------------------------------
+_service_local = threading.local()
+
+
 def get_youtube_service():
-    return build("youtube", "v3", developerKey=API_KEY, static_discovery=False)
+    # Built once per thread from the bundled discovery document; httplib2
+    # clients can't be shared across threads
+    youtube = getattr(_service_local, "youtube", None)
+    if youtube is None:
+        youtube = build("youtube", "v3", developerKey=API_KEY,
+                        cache_discovery=False, static_discovery=True)
+        _service_local.youtube = youtube
+    return youtube
+
+
+# Long-lived pools: worker threads and their clients' keep-alive connections
+# survive across requests instead of reconnecting for every analysis.
+# Channel analyses (search/channels/playlistItems) and videos.list batches run
+# on separate pools so channel workers can wait on metadata without deadlock.
+_channel_pool = ThreadPoolExecutor(max_workers=CHANNEL_WORKERS, thread_name_prefix="yt-channel")
+_metadata_pool = ThreadPoolExecutor(max_workers=METADATA_WORKERS, thread_name_prefix="yt-meta")
+
+
+def is_rate_limited(e):
+    # 403 also covers quotaExceeded/forbidden, which won't recover by waiting
+    status = getattr(e.resp, "status", None)
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    details = getattr(e, "error_details", None)
+    if not isinstance(details, list):
+        return False
+    return any(isinstance(d, dict) and d.get("reason") in RETRYABLE_REASONS for d in details)
+
+
+def retry_delay(e, attempt):
+    # Honour Retry-After when present, else exponential backoff; capped
+    try:
+        delay = float(e.resp.get("retry-after"))
+    except (TypeError, ValueError):
+        delay = 2 ** attempt
+    return min(delay, MAX_RETRY_AFTER)
+
+
+def execute_with_backoff(req):
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            return req.execute()
+        except HttpError as e:
+            if not is_rate_limited(e) or attempt == MAX_RETRIES:
+                raise
+            time.sleep(retry_delay(e, attempt))
+
+
+def ojsonify(obj, status=200):
+    return app.response_class(
+        orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype="application/json"
+    )
+
+
+# Serialized bodies of successful responses, keyed by route + JSON payload
+_response_cache = TTLCache(maxsize=512, ttl=RESPONSE_CACHE_TTL)
+_response_cache_lock = threading.Lock()
+
+
+def response_cache_key(data):
+    payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(request.path.encode() + b"\0" + payload, digest_size=16).digest()
+
+
+def cacheable_response(body):
+    resp = app.response_class(body, status=200, mimetype="application/json")
+    resp.headers["Cache-Control"] = f"public, max-age={RESPONSE_CACHE_TTL}"
+    return resp
+
+
+def get_cached_response(key):
+    with _response_cache_lock:
+        body = _response_cache.get(key)
+    return cacheable_response(body) if body is not None else None
+
+
+def cache_response(key, obj):
+    body = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    with _response_cache_lock:
+        _response_cache[key] = body
+    return cacheable_response(body)
+
+
+_NUMBER_UNITS = ((1_000_000_000_000, "T"), (1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
 
 
 def short_number(n):
-    try:
-        n = int(n)
-    except:
-        return str(n or "0")
+    n = int(n or 0)
     if n < 1000:
         return str(n)
-    value = float(n)
-    for unit in ["", "K", "M", "B", "T"]:
-        if abs(value) < 1000:
-            if unit == "":
-                return f"{int(value)}"
+    for threshold, unit in _NUMBER_UNITS:
+        if n >= threshold:
+            value = n / threshold
             if value >= 100:
                 return f"{int(round(value))}{unit}"
-            return f"{round(value, 1)}{unit}"
-        value /= 1000.0
-    return f"{round(value,1)}T"
+            return f"{value:.1f}{unit}"
 
 
 def human_date(iso):
@@ -71,26 +176,16 @@ def human_date(iso):
         return "N/A"
 
 
+_DURATION_RE = re.compile(r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+
+
+@lru_cache(maxsize=4096)
 def parse_iso8601_duration_to_seconds(dur: str) -> int:
-    if not dur:
+    m = _DURATION_RE.match(dur or "")
+    if not m:
         return 0
-    dur = dur.replace("PT", "")
-    num = ""
-    sec = 0
-    for ch in dur:
-        if ch.isdigit():
-            num += ch
-        else:
-            if num == "":
-                continue
-            if ch == "H":
-                sec += int(num) * 3600
-            elif ch == "M":
-                sec += int(num) * 60
-            elif ch == "S":
-                sec += int(num)
-            num = ""
-    return sec
+    d, h, mn, s = m.groups()
+    return int(d or 0) * 86400 + int(h or 0) * 3600 + int(mn or 0) * 60 + int(s or 0)
 
 
 def extract_channel_from_input(inp: str):
@@ -118,10 +213,40 @@ def extract_channel_from_input(inp: str):
 # ------------------------------------------------------
 # YOUTUBE API HELPERS
 # ------------------------------------------------------
+_channel_cache = TTLCache(maxsize=1024, ttl=CHANNEL_CACHE_TTL)
+_resolve_cache = TTLCache(maxsize=1024, ttl=CHANNEL_CACHE_TTL)
+_playlist_cache = TTLCache(maxsize=256, ttl=PLAYLIST_CACHE_TTL)
+_playlist_cache_lock = threading.Lock()
+
+
+def cache_found(cache):
+    # Like cachetools.cached, but keyed on the value only (the youtube client
+    # is ignored) and None is never stored, so a failed or empty lookup is
+    # retried on the next request instead of being served as "not found"
+    lock = threading.Lock()
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(youtube, value):
+            key = hashkey(value)
+            with lock:
+                result = cache.get(key)
+            if result is None:
+                result = fn(youtube, value)
+                if result is not None:
+                    with lock:
+                        cache[key] = result
+            return result
+        return wrapper
+    return decorator
+
+
+@cache_found(_channel_cache)
 def fetch_channel_basic(youtube, channel_id):
     resp = youtube.channels().list(
         part="snippet,statistics,contentDetails",
-        id=channel_id
+        id=channel_id,
+        fields=CHANNEL_FIELDS
     ).execute()
 
     items = resp.get("items", [])
@@ -145,6 +270,7 @@ def fetch_channel_basic(youtube, channel_id):
     }
 
 
+@cache_found(_resolve_cache)
 def resolve_handle_to_channel_id(youtube, canonical_url_or_handle):
     try:
         q = canonical_url_or_handle.strip().split("/")[-1]
@@ -152,7 +278,8 @@ def resolve_handle_to_channel_id(youtube, canonical_url_or_handle):
             part="snippet",
             q=q,
             type="channel",
-            maxResults=1
+            maxResults=1,
+            fields="items(snippet/channelId)"
         ).execute()
         items = resp.get("items", [])
         if items:
@@ -162,7 +289,8 @@ def resolve_handle_to_channel_id(youtube, canonical_url_or_handle):
     return None
 
 
-def fetch_all_video_ids_from_playlist(youtube, playlist):
+def fetch_all_video_ids_from_playlist(youtube, playlist, on_page=None):
+    # on_page(ids) is called as each page arrives
     ids = []
     next_page = None
 
@@ -171,13 +299,15 @@ def fetch_all_video_ids_from_playlist(youtube, playlist):
             part="contentDetails",
             playlistId=playlist,
             maxResults=50,
-            pageToken=next_page
+            pageToken=next_page,
+            fields=PLAYLIST_ITEM_FIELDS
         ).execute()
 
-        for it in resp.get("items", []):
-            vid = it["contentDetails"].get("videoId")
-            if vid:
-                ids.append(vid)
+        page = [it["contentDetails"].get("videoId") for it in resp.get("items", [])]
+        page = [vid for vid in page if vid]
+        ids.extend(page)
+        if on_page and page:
+            on_page(page)
 
         next_page = resp.get("nextPageToken")
         if not next_page:
@@ -186,51 +316,181 @@ def fetch_all_video_ids_from_playlist(youtube, playlist):
     return ids
 
 
-def fetch_videos_metadata(youtube, ids):
-    out = []
-    for i in range(0, len(ids), BATCH_SIZE):
-        batch = ids[i:i+BATCH_SIZE]
-        resp = youtube.videos().list(
-            part="snippet,contentDetails,statistics",
-            id=",".join(batch)
-        ).execute()
+def parse_video_item(v):
+    sn = v.get("snippet", {})
+    st = v.get("statistics", {})
+    cd = v.get("contentDetails", {})
+
+    dur_sec = parse_iso8601_duration_to_seconds(cd.get("duration", ""))
+
+    # Parsed once here so cached records never re-parse the timestamp
+    try:
+        published_dt = np.datetime64((sn.get("publishedAt") or "NaT").rstrip("Z"), "s")
+    except ValueError:
+        published_dt = np.datetime64("NaT", "s")
+
+    return {
+        "id": v.get("id"),
+        "title": sn.get("title", ""),
+        "description": sn.get("description", "") or "",
+        "publishedAt": sn.get("publishedAt"),
+        "views": int(st.get("viewCount", 0)),
+        "duration_seconds": dur_sec,
+        "published_dt": published_dt,
+    }
+
 
-        for v in resp.get("items", []):
-            sn = v.get("snippet", {})
-            st = v.get("statistics", {})
-            cd = v.get("contentDetails", {})
+def videos_list_request(youtube, batch):
+    return youtube.videos().list(
+        part="snippet,contentDetails,statistics",
+        id=",".join(batch),
+        fields=VIDEO_FIELDS
+    )
 
-            dur_sec = parse_iso8601_duration_to_seconds(cd.get("duration", ""))
 
-            out.append({
-                "id": v.get("id"),
-                "title": sn.get("title", ""),
-                "description": sn.get("description", "") or "",
-                "publishedAt": sn.get("publishedAt"),
-                "views": int(st.get("viewCount", 0)),
-                "duration_seconds": dur_sec,
-            })
+def fetch_videos_group(group):
+    # Coalesce several videos.list calls into one HTTP batch round trip
+    youtube = get_youtube_service()
+    if len(group) == 1:
+        resp = execute_with_backoff(videos_list_request(youtube, group[0]))
+        return [parse_video_item(v) for v in resp.get("items", [])]
+
+    responses = {}
+    failed = []
 
+    def on_response(request_id, resp, exc):
+        if exc is not None:
+            failed.append((int(request_id), exc))
+        else:
+            responses[int(request_id)] = resp
+
+    http_batch = youtube.new_batch_http_request(callback=on_response)
+    for n, batch in enumerate(group):
+        http_batch.add(videos_list_request(youtube, batch), request_id=str(n))
+    execute_with_backoff(http_batch)
+
+    # Rate-limited sub-requests are retried one by one; other errors raise
+    for n, exc in failed:
+        if not (isinstance(exc, HttpError) and is_rate_limited(exc)):
+            raise exc
+        time.sleep(retry_delay(exc, 0))
+        responses[n] = execute_with_backoff(videos_list_request(youtube, group[n]))
+
+    out = []
+    for n in range(len(group)):
+        out.extend(parse_video_item(v) for v in responses[n].get("items", []))
     return out
 
 
+def fetch_videos_metadata(youtube, ids, video_cache=None):
+    # video_cache maps video id -> parsed record and may be shared by the
+    # channels of one /api/analyze call, so collabs are only fetched once
+    if video_cache is None:
+        video_cache = {}
+
+    missing = [i for i in ids if i not in video_cache]
+    batches = [missing[i:i+BATCH_SIZE] for i in range(0, len(missing), BATCH_SIZE)]
+    groups = [batches[i:i+REQUESTS_PER_HTTP_BATCH]
+              for i in range(0, len(batches), REQUESTS_PER_HTTP_BATCH)]
+
+    for items in _metadata_pool.map(fetch_videos_group, groups):
+        for v in items:
+            video_cache[v["id"]] = v
+
+    return [video_cache[i] for i in ids if i in video_cache]
+
+
+def fetch_playlist_videos(youtube, playlist, video_cache=None):
+    # Pipeline paging and metadata: every REQUESTS_PER_HTTP_BATCH pages are
+    # queued on the pool as one HTTP batch while later pages are still paged
+    if video_cache is None:
+        video_cache = {}
+
+    # Recently paged playlists skip paging and fetch metadata in batches
+    with _playlist_cache_lock:
+        ids = _playlist_cache.get(playlist)
+    if ids is not None:
+        return fetch_videos_metadata(youtube, ids, video_cache)
+
+    pending = []
+    group = []
+
+    def on_page(page):
+        missing = [i for i in page if i not in video_cache]
+        if missing:
+            group.append(missing)
+        if len(group) == REQUESTS_PER_HTTP_BATCH:
+            pending.append(_metadata_pool.submit(fetch_videos_group, group[:]))
+            group.clear()
+
+    # Don't keep spending quota on pages of an analysis that already failed,
+    # whether paging itself or one of the queued metadata groups raised
+    try:
+        ids = fetch_all_video_ids_from_playlist(youtube, playlist, on_page)
+        if group:
+            pending.append(_metadata_pool.submit(fetch_videos_group, group))
+
+        with _playlist_cache_lock:
+            _playlist_cache[playlist] = ids
+
+        for fut in pending:
+            for v in fut.result():
+                video_cache[v["id"]] = v
+    except Exception:
+        for fut in pending:
+            fut.cancel()
+        raise
+
+    return [video_cache[i] for i in ids if i in video_cache]
+
+
+def video_columns(videos_meta):
+    # Struct-of-arrays view of the video records for vectorized reductions
+    n = len(videos_meta)
+    return {
+        # Walked in Python, so kept as a plain list
+        "descs": [v["description"].strip() for v in videos_meta],
+        "views": np.fromiter((v["views"] for v in videos_meta), dtype=np.int64, count=n),
+        "durations": np.fromiter((v["duration_seconds"] for v in videos_meta), dtype=np.int64, count=n),
+        "published": np.array([v["published_dt"] for v in videos_meta], dtype="datetime64[s]"),
+    }
+
+
 # ------------------------------------------------------
 # ORIGINALITY ENGINE
 # ------------------------------------------------------
-def metadata_originality_analysis(videos_meta):
-    N = len(videos_meta)
-    titles = [v["title"].strip() for v in videos_meta]
-    descs = [v["description"].strip() for v in videos_meta]
-    durations = [v["duration_seconds"] for v in videos_meta]
-
-    desc_counts = Counter(descs)
-    desc_dup_ratio = sum(1 for d in descs if d and desc_counts[d] > 1) / max(1, N)
-    empty_desc_ratio = sum(1 for d in descs if not d or len(d) < 10) / max(1, N)
+def metadata_originality_analysis(cols):
+    durations = cols["durations"]
+    N = len(durations)
+    descs = cols["descs"]
+
+    # One pass: short/empty descriptions and videos sharing a description
+    seen = set()
+    dup = set()
+    dup_count = 0
+    empty_count = 0
+    for d in descs:
+        if len(d) < 10:
+            empty_count += 1
+            if not d:
+                continue
+        if d in dup:
+            dup_count += 1
+        elif d in seen:
+            dup.add(d)
+            dup_count += 2
+        else:
+            seen.add(d)
 
-    shorts_ratio = sum(1 for d in durations if d <= SHORTS_MAX_SECONDS) / max(1, N)
+    desc_dup_ratio = dup_count / max(1, N)
+    empty_desc_ratio = empty_count / max(1, N)
 
-    avg_dur = sum(durations) / max(1, N)
-    std_dur = (sum((x-avg_dur)**2 for x in durations) / max(1, N)) ** 0.5
+    if N:
+        shorts_ratio = float((durations <= SHORTS_MAX_SECONDS).mean())
+        avg_dur = float(durations.mean())
+        std_dur = float(durations.std())
+    else:
+        shorts_ratio = avg_dur = std_dur = 0.0
     dur_uniformity = 1 - (std_dur / (avg_dur + 1))
 
     score = 100
@@ -263,7 +523,7 @@ def metadata_originality_analysis(videos_meta):
 # ------------------------------------------------------
 # FULL CHANNEL ANALYZER
 # ------------------------------------------------------
-def analyze_channel_full(channel_input):
+def analyze_channel_full(channel_input, video_cache=None):
     youtube = get_youtube_service()
 
     cid, canonical = extract_channel_from_input(channel_input)
@@ -277,60 +537,46 @@ def analyze_channel_full(channel_input):
         return {"error": "Channel not found"}
 
     uploads = ch["uploads_playlist"]
-    video_ids = fetch_all_video_ids_from_playlist(youtube, uploads) if uploads else []
-    videos_meta = fetch_videos_metadata(youtube, video_ids)
+    videos_meta = fetch_playlist_videos(youtube, uploads, video_cache) if uploads else []
+
+    cols = video_columns(videos_meta)
+    views = cols["views"]
+    durations = cols["durations"]
+    published = cols["published"]
 
     # Split shorts & long videos
-    shorts = [v for v in videos_meta if v["duration_seconds"] <= SHORTS_MAX_SECONDS]
-    longs  = [v for v in videos_meta if v["duration_seconds"] > SHORTS_MAX_SECONDS]
+    shorts_mask = durations <= SHORTS_MAX_SECONDS
+    longs_mask = ~shorts_mask
 
-    shorts_count = len(shorts)
-    long_count = len(longs)
+    shorts_count = int(shorts_mask.sum())
+    long_count = int(longs_mask.sum())
 
-    total_shorts_views = sum(v["views"] for v in shorts)
-    total_long_views   = sum(v["views"] for v in longs)
+    total_shorts_views = int(views[shorts_mask].sum())
+    total_long_views   = int(views[longs_mask].sum())
 
     # Last uploads
-    def latest(vlist):
-        if not vlist:
-            return "N/A"
-        try:
-            return human_date(max(vlist, key=lambda x: x["publishedAt"])["publishedAt"])
-        except:
-            return "N/A"
-
-    last_short = latest(shorts)
-    last_video = latest(longs)
+    has_pub = ~np.isnat(published)
 
-    # 30-day stats
-    cut = datetime.now(timezone.utc) - timedelta(days=RECENT_DAYS)
-    shorts_30 = []
-    longs_30 = []
+    def latest(mask):
+        ts = published[mask & has_pub]
+        return human_date(str(ts.max())) if ts.size else "N/A"
 
-    for v in videos_meta:
-        try:
-            dt = datetime.fromisoformat(v["publishedAt"].replace("Z","+00:00"))
-        except:
-            continue
+    last_short = latest(shorts_mask)
+    last_video = latest(longs_mask)
 
-        if dt >= cut:
-            if v["duration_seconds"] <= SHORTS_MAX_SECONDS:
-                shorts_30.append(v)
-            else:
-                longs_30.append(v)
+    # 30-day stats
+    cut = np.datetime64(int(time.time()), "s") - np.timedelta64(RECENT_DAYS, "D")
+    recent = published >= cut
 
-    shorts_30_count = len(shorts_30)
-    longs_30_count  = len(longs_30)
+    shorts_30_count = int((recent & shorts_mask).sum())
+    longs_30_count  = int((recent & longs_mask).sum())
 
-    shorts_30_views = sum(v["views"] for v in shorts_30)
-    longs_30_views  = sum(v["views"] for v in longs_30)
+    shorts_30_views = int(views[recent & shorts_mask].sum())
+    longs_30_views  = int(views[recent & longs_mask].sum())
 
     # Average durations
-    def avg_duration(lst):
-        return sum(v["duration_seconds"] for v in lst) / len(lst) if lst else 0
-
-    avg_short = avg_duration(shorts)
-    avg_long  = avg_duration(longs)
+    avg_short = float(durations[shorts_mask].mean()) if shorts_count else 0
+    avg_long  = float(durations[longs_mask].mean()) if long_count else 0
 
     avg_short_human = f"{int(avg_short//60)}m {int(avg_short%60)}s" if avg_short else "N/A"
     avg_long_human  = f"{int(avg_long//60)}m {int(avg_long%60)}s" if avg_long else "N/A"
@@ -351,7 +597,7 @@ def analyze_channel_full(channel_input):
     uploads_per_week_recent = round((shorts_30_count + longs_30_count) / RECENT_DAYS * 7, 2)
 
     # Originality
-    originality_score, originality_explanation, originality_signals = metadata_originality_analysis(videos_meta)
+    originality_score, originality_explanation, originality_signals = metadata_originality_analysis(cols)
 
     return {
         "channel_id": ch["channel_id"],
@@ -396,6 +642,18 @@ def analyze_channel_full(channel_input):
     }
 
 
+def preview_channel(inp):
+    youtube = get_youtube_service()
+
+    cid, canonical = extract_channel_from_input(inp)
+    if not cid:
+        cid = resolve_handle_to_channel_id(youtube, canonical or inp)
+    if not cid:
+        return None
+
+    return fetch_channel_basic(youtube, cid)
+
+
 # ------------------------------------------------------
 # ROUTES
 # ------------------------------------------------------
@@ -409,22 +667,19 @@ def preview():
     try:
         data = request.get_json()
         if not data or "input" not in data:
-            return jsonify({"success": False, "error": "Invalid request"}), 400
+            return ojsonify({"success": False, "error": "Invalid request"}, 400)
 
-        inp = data["input"].strip()
-        youtube = get_youtube_service()
+        key = response_cache_key(data)
+        cached_resp = get_cached_response(key)
+        if cached_resp is not None:
+            return cached_resp
 
-        cid, canonical = extract_channel_from_input(inp)
-        if not cid:
-            cid = resolve_handle_to_channel_id(youtube, canonical or inp)
-        if not cid:
-            return jsonify({"success": False, "error": "Channel not found"}), 404
-
-        ch = fetch_channel_basic(youtube, cid)
+        inp = data["input"].strip()
+        ch = preview_channel(inp)
         if not ch:
-            return jsonify({"success": False, "error": "Channel not found"}), 404
+            return ojsonify({"success": False, "error": "Channel not found"}, 404)
 
-        return jsonify({
+        return cache_response(key, {
             "success": True,
             "channel_id": ch["channel_id"],
             "title": ch["title"],
@@ -435,7 +690,7 @@ def preview():
 
     except Exception as e:
         print("Preview Error:", e)
-        return jsonify({"success": False, "error": "Server error"}), 500
+        return ojsonify({"success": False, "error": "Server error"}, 500)
 
 
 @app.route("/api/analyze", methods=["POST"])
@@ -444,21 +699,35 @@ def api_analyze():
         data = request.get_json()
         inputs = data.get("channels", [])
 
+        key = response_cache_key(data)
+        cached_resp = get_cached_response(key)
+        if cached_resp is not None:
+            return cached_resp
+
         results = []
         errors = []
 
-        for c in inputs[:MAX_CHANNELS]:
-            report = analyze_channel_full(c)
+        # Channels are independent and I/O-bound, so fetch them concurrently.
+        channels = inputs[:MAX_CHANNELS]
+        video_cache = {}
+        futures = [(c, _channel_pool.submit(analyze_channel_full, c, video_cache)) for c in channels]
+
+        for c, fut in futures:
+            report = fut.result()
             if "error" in report:
                 errors.append({"channel": c, "error": report["error"]})
             else:
                 results.append(report)
 
-        return jsonify({"success": True, "results": results, "errors": errors})
+        body = {"success": True, "results": results, "errors": errors}
+        # Per-channel failures may be transient, so only fully clean reports are cached
+        if errors:
+            return ojsonify(body)
+        return cache_response(key, body)
 
     except Exception as e:
         print("Analyze Error:", e)
-        return jsonify({"success": False, "error": "Server error"}), 500
+        return ojsonify({"success": False, "error": "Server error"}, 500)
 
 
 # ------------------------------------------------------